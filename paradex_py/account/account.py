@@ -1,3 +1,4 @@
+import functools
 import time
 from enum import IntEnum
 from typing import Optional
@@ -26,6 +27,15 @@ class CustomStarknetChainId(IntEnum):
     PRIVATE_SN_TESTNET_SEPOLIA = int_from_bytes(b"PRIVATE_SN_POTC_SEPOLIA")
 
 
+# Constructor selector of the Paraclear account proxy
+_INITIALIZE_SELECTOR = get_selector_from_name("initialize")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_chain_id(starknet_chain_id: str) -> CustomStarknetChainId:
+    return CustomStarknetChainId(int.from_bytes(starknet_chain_id.encode("ascii"), "big"))
+
+
 class ParadexAccount:
     """Class to generate and manage Paradex account.
         Initialized along with `Paradex` class.
@@ -77,18 +87,19 @@ class ParadexAccount:
 
         # Create starknet account
         client = FullNodeClient(node_url=config.starknet_fullnode_rpc_url)
-        self.l2_chain_id = int_from_bytes(config.starknet_chain_id.encode())
+        chain = _get_chain_id(config.starknet_chain_id)
+        self.l2_chain_id = int(chain)
         self.starknet = StarknetAccount(
             client=client,
             address=self.l2_address,
             key_pair=key_pair,
-            chain=CustomStarknetChainId(self.l2_chain_id),
+            chain=chain,
         )
 
     def _account_address(self) -> int:
         calldata = [
             int_from_hex(self.config.paraclear_account_hash),
-            get_selector_from_name("initialize"),
+            _INITIALIZE_SELECTOR,
             2,
             self.l2_public_key,
             0,
@@ -17,6 +17,8 @@ from paradex_py.utils import random_max_fee
 from .typed_data import TypedData
 from .utils import message_signature, typed_data_to_message_hash
 
+_INVOKE_SCHEMA = marshmallow_dataclass.class_schema(InvokeV1)()
+
 
 class Account(StarknetAccount):
     def __init__(
@@ -141,9 +143,8 @@ class Account(StarknetAccount):
         return deploy_result
 
     def print_invoke(self, invoke: InvokeV1):
-        invoke_schema = marshmallow_dataclass.class_schema(InvokeV1)()
         print("\n---")
-        print(invoke_schema.dumps(invoke))
+        print(_INVOKE_SCHEMA.dumps(invoke))
         print("---\n")
 
     def sign_message(self, typed_data: TypedData) -> List[int]:
@@ -1,6 +1,7 @@
 import functools
 import hashlib
-from typing import List, Sequence
+import json
+from typing import Dict, List, Sequence
 
 from eth_account.messages import SignableMessage, encode_typed_data
 from ledgereth.accounts import find_account
@@ -13,34 +14,41 @@ from starknet_crypto_py import verify as rs_verify
 from starknet_py.common import int_from_hex
 from starknet_py.constants import EC_ORDER
 from starknet_py.net.models.typed_data import TypedData
+from starknet_py.utils.typed_data import Parameter
 from starknet_py.utils.typed_data import TypedData as TypedDataDataclass
 from web3.auto import w3
 
 from paradex_py.utils import raise_value_error
 
 SHA256_EC_MAX_DIGEST = 2**256
+# Grinding bound for the only limit used in practice
+_EC_ORDER_MAX_ALLOWED_VALUE = SHA256_EC_MAX_DIGEST - (SHA256_EC_MAX_DIGEST % EC_ORDER)
 
 
-def _padded_hex(x: int) -> str:
-    # Hex string should have an even
-    # number of characters to convert to bytes.
-    hex_str = hex(x)[2:]
-    return hex_str if len(hex_str) % 2 == 0 else "0" + hex_str
+def _int_to_bytes(x: int) -> bytes:
+    # Minimal big-endian encoding, same bytes as the
+    # even-length hex string of x (at least one byte).
+    return x.to_bytes((x.bit_length() + 7) // 8 or 1, "big")
 
 
-def _indexed_sha256(seed: int, index: int) -> int:
-    digest = hashlib.sha256(bytes.fromhex(_padded_hex(seed) + _padded_hex(index))).hexdigest()
-    return int_from_hex(digest)
+def _indexed_sha256(seed: bytes, index: int) -> int:
+    digest = hashlib.sha256(seed + _int_to_bytes(index)).digest()
+    return int.from_bytes(digest, "big")
 
 
 def _grind_key(key_seed: int, key_value_limit: int) -> int:
-    max_allowed_value = SHA256_EC_MAX_DIGEST - (SHA256_EC_MAX_DIGEST % key_value_limit)
+    if key_value_limit == EC_ORDER:
+        max_allowed_value = _EC_ORDER_MAX_ALLOWED_VALUE
+    else:
+        max_allowed_value = SHA256_EC_MAX_DIGEST - (SHA256_EC_MAX_DIGEST % key_value_limit)
     current_index = 0
+    # Seed is the same for every attempt, encode it once
+    seed = _int_to_bytes(key_seed)
 
-    key = _indexed_sha256(seed=key_seed, index=current_index)
+    key = _indexed_sha256(seed=seed, index=current_index)
     while key >= max_allowed_value:
         current_index += 1
-        key = _indexed_sha256(seed=key_seed, index=current_index)
+        key = _indexed_sha256(seed=seed, index=current_index)
 
     return key % key_value_limit
 
@@ -91,11 +99,30 @@ def flatten_signature(sig: List[int]) -> str:
 
 
 def unflatten_signature(sig: str) -> list:
-    return [int(x) for x in sig[2:-2].split('","')]
+    return [int(x) for x in json.loads(sig)]
+
+
+@functools.lru_cache(maxsize=64)
+def _load_typed_data_types(types_key: tuple) -> Dict[str, List[Parameter]]:
+    return {type_name: [Parameter(name=name, type=type_) for name, type_ in params] for type_name, params in types_key}
+
+
+def _typed_data_types(types: dict) -> Dict[str, List[Parameter]]:
+    # Types are the same for every message of a kind, parse them
+    # once instead of running the marshmallow schema per signature.
+    types_key = tuple(
+        (type_name, tuple((param["name"], param["type"]) for param in params)) for type_name, params in types.items()
+    )
+    return _load_typed_data_types(types_key)
 
 
 def typed_data_to_message_hash(typed_data: TypedData, address: str) -> int:
-    typed_data_dataclass = TypedDataDataclass.from_dict(typed_data)
+    typed_data_dataclass = TypedDataDataclass(
+        types=_typed_data_types(typed_data["types"]),
+        primary_type=typed_data["primaryType"],
+        domain=typed_data["domain"],
+        message=typed_data["message"],
+    )
     return typed_data_dataclass.message_hash(address)
 
 
@@ -128,7 +155,7 @@ def compute_hash_on_elements(data: Sequence) -> int:
     The length is appended in order to avoid collisions of the following kind:
     H([x,y,z]) = h(h(x,y),z) = H([w, z]) where w = h(x,y).
     """
-    return functools.reduce(pedersen_hash, [*data, len(data)], 0)
+    return functools.reduce(rs_pedersen_hash, [*data, len(data)], 0)
 
 
 def message_signature(msg_hash: int, priv_key: int, seed: int = 32) -> tuple[int, int]:
@@ -147,4 +174,7 @@ def verify_message_signature(msg_hash: int, signature: List[int], public_key: in
     Returns true if public_key signs the message.
     """
     r, s = signature
+    # Out of range r or s can never be a valid signature, skip the native call
+    if not (0 < r < EC_ORDER and 0 < s < EC_ORDER):
+        return False
     return rs_verify(msg_hash=msg_hash, r=r, s=s, public_key=public_key)
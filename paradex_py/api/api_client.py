@@ -1,22 +1,64 @@
+import asyncio
+import base64
+import copy
+import functools
+import json
 import logging
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import httpx
 
 from paradex_py.account.account import ParadexAccount
 from paradex_py.api.http_client import HttpClient, HttpMethod
 from paradex_py.api.models import AccountSummary, AccountSummarySchema, AuthSchema, SystemConfig, SystemConfigSchema
 from paradex_py.common.order import Order
+from paradex_py.constants import JWT_REFRESH_LEEWAY, MARKETS_CACHE_TTL, SYSTEM_CONFIG_CACHE_TTL
 from paradex_py.environment import Environment
 from paradex_py.utils import raise_value_error
 
+# Load options are fixed at construction so each load() call does not have to resolve them
+_AUTH_SCHEMA = AuthSchema(unknown="exclude", partial=True)
+_ACCOUNT_SUMMARY_SCHEMA = AccountSummarySchema(unknown="exclude", partial=True)
+_SYSTEM_CONFIG_SCHEMA = SystemConfigSchema(unknown="exclude", partial=True)
+
+
+class _BearerAuth(httpx.Auth):
+    """Sets the current JWT on each request as it is sent,
+    so refreshing the token never mutates the shared client headers.
+    """
+
+    def __init__(self) -> None:
+        self.authorization: Optional[str] = None
+
+    def auth_flow(self, request: httpx.Request):
+        if self.authorization is not None:
+            request.headers["Authorization"] = self.authorization
+        yield request
+
+
+def _jwt_lifetime(jwt_token: str) -> Optional[int]:
+    # Both claims are stamped by the server, their difference does not depend on the local clock
+    try:
+        payload = jwt_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return int(claims["exp"]) - int(claims["iat"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
 
 class ParadexApiClient(HttpClient):
     """Class to interact with Paradex REST API.
         Initialized along with `Paradex` class.
+        Reuse one instance for the lifetime of the application so its pooled
+        connections are kept alive, close it with `close()` or `async with`.
 
     Args:
         env (Environment): Environment
         logger (logging.Logger, optional): Logger. Defaults to None.
+        http2 (bool, optional): Multiplex requests over HTTP/2, requires `httpx[http2]`. Defaults to False.
 
     Examples:
         >>> from paradex_py import Paradex
@@ -30,14 +72,26 @@ class ParadexApiClient(HttpClient):
         self,
         env: Environment,
         logger: Optional[logging.Logger] = None,
+        http2: bool = False,
     ):
         self.env = env
         self.logger = logger or logging.getLogger(__name__)
-        super().__init__()
+        super().__init__(http2=http2)
         self.api_url = f"https://api.{self.env}.paradex.trade/v1"
+        self.account: Optional[ParadexAccount] = None
+        self._bearer_auth = _BearerAuth()
+        self.client.auth = self._bearer_auth
+        # Responses of near-static public endpoints: key -> (monotonic expiry, value)
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        # One lock per cache key so concurrent misses issue a single request
+        self._cache_locks: Dict[Tuple, threading.Lock] = {}
+        self._cache_locks_guard = threading.Lock()
 
-    async def __aexit__(self):
-        self.client.close()
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
 
     def init_account(self, account: ParadexAccount):
         self.account = account
@@ -45,31 +99,89 @@ class ParadexApiClient(HttpClient):
         self.auth()
 
     def onboarding(self):
+        if self.account is None:
+            return raise_value_error(f"{self.classname}: Account not initialized")
         headers = self.account.onboarding_headers()
         payload = {"public_key": hex(self.account.l2_public_key)}
         self.post(api_url=self.api_url, path="onboarding", headers=headers, payload=payload)
 
     def auth(self):
+        if self.account is None:
+            return raise_value_error(f"{self.classname}: Account not initialized")
         headers = self.account.auth_headers()
         res = self.post(api_url=self.api_url, path="auth", headers=headers)
-        data = AuthSchema().load(res, unknown="exclude", partial=True)
+        data = _AUTH_SCHEMA.load(res)
         self.auth_timestamp = time.time()
+        # Refresh ahead of the token expiry, halfway through the lifetime of tokens too
+        # short-lived for the leeway, every 4 minutes if it carries no usable iat/exp claims.
+        # The lifetime comes from the server claims and the deadline is kept on the monotonic
+        # clock, so local clock skew or jumps while the token is live do not shift it.
+        lifetime = _jwt_lifetime(data.jwt_token)
+        if lifetime is None or lifetime <= 0:
+            refresh_in: float = 4 * 60
+        elif lifetime > 2 * JWT_REFRESH_LEEWAY:
+            refresh_in = lifetime - JWT_REFRESH_LEEWAY
+        else:
+            refresh_in = lifetime / 2
+        self.auth_deadline = time.monotonic() + refresh_in
         self.account.set_jwt_token(data.jwt_token)
-        self.client.headers.update({"Authorization": f"Bearer {data.jwt_token}"})
+        self._bearer_auth.authorization = f"Bearer {data.jwt_token}"
 
     def _validate_auth(self):
         if self.account is None:
-            return raise_value_error(f"{self.classname}: Account not found")
-        # Refresh JWT if it's older than 4 minutes
-        if time.time() - self.auth_timestamp > 4 * 60:
+            return raise_value_error(f"{self.classname}: Account not initialized")
+        if time.monotonic() >= self.auth_deadline:
             self.auth()
 
+    # Helpers go straight to request(), the client auth adds the JWT
     def _get(self, path: str, params: Optional[dict] = None) -> dict:
-        return self.get(api_url=self.api_url, path=path, params=params)
+        return self.request(url=f"{self.api_url}/{path}", http_method=HttpMethod.GET, params=params)
+
+    def _get_cached(self, key: Tuple, ttl: float, fetch: Callable[[], Any]) -> Any:
+        entry = self._cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            with self._cache_locks_guard:
+                lock = self._cache_locks.setdefault(key, threading.Lock())
+            with lock:
+                # Another thread may have refreshed the entry while this one was waiting
+                entry = self._cache.get(key)
+                if entry is None or entry[0] <= time.monotonic():
+                    entry = (time.monotonic() + ttl, fetch())
+                    self._cache[key] = entry
+        # Each caller gets its own copy so mutating a result never alters the cache
+        return copy.deepcopy(entry[1])
+
+    def invalidate_cache(self, path: Optional[str] = None) -> None:
+        """Drop cached responses of near-static endpoints so the next call refetches them.
+
+        Args:
+            path: Endpoint path to invalidate, e.g. `markets` or `system/config`.
+                Defaults to None which clears the whole cache.
+        """
+        if path is None:
+            self._cache.clear()
+            return
+        # Iterate a snapshot, other threads may add entries meanwhile
+        for key in list(self._cache):
+            if key[0] == path:
+                self._cache.pop(key, None)
+
+    def _iter_pages(self, fetch: Callable[[Dict], Dict], params: Optional[Dict] = None) -> Iterator[Dict]:
+        params = params or {}
+        # The next page is requested in the background while the caller consumes the current one
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = fetch(params)
+            while True:
+                cursor = page.get("next")
+                next_page = executor.submit(fetch, {**params, "cursor": cursor}) if cursor else None
+                yield from page.get("results") or []
+                if next_page is None:
+                    return
+                page = next_page.result()
 
     def _get_authorized(self, path: str, params: Optional[dict] = None) -> dict:
         self._validate_auth()
-        return self._get(path=path, params=params)
+        return self.request(url=f"{self.api_url}/{path}", http_method=HttpMethod.GET, params=params)
 
     def _post_authorized(
         self,
@@ -79,11 +191,58 @@ class ParadexApiClient(HttpClient):
         headers: Optional[dict] = None,
     ) -> dict:
         self._validate_auth()
-        return self.post(api_url=self.api_url, path=path, payload=payload, params=params, headers=headers)
+        return self.request(
+            url=f"{self.api_url}/{path}",
+            http_method=HttpMethod.POST,
+            payload=payload,
+            params=params,
+            headers=headers,
+        )
 
     def _delete_authorized(self, path: str, params: Optional[dict] = None) -> dict:
         self._validate_auth()
-        return self.delete(api_url=self.api_url, path=path, params=params)
+        return self.request(url=f"{self.api_url}/{path}", http_method=HttpMethod.DELETE, params=params)
+
+    def fetch_many(self, calls: Sequence[Callable[[], Any]], max_workers: int = 16) -> List[Any]:
+        """Run independent fetches concurrently over the shared connection pool.
+            Results are returned in the same order as `calls`,
+            the first failing call re-raises its exception.
+
+        Args:
+            calls: Zero-argument callables, e.g. bound `fetch_*` methods or `functools.partial`
+            max_workers: Maximum number of requests in flight
+
+        Examples:
+            >>> from functools import partial
+            >>> orders, positions, book = paradex.api_client.fetch_many([
+            ...     paradex.api_client.fetch_orders,
+            ...     paradex.api_client.fetch_positions,
+            ...     partial(paradex.api_client.fetch_orderbook, "ETH-USD-PERP"),
+            ... ])
+        """
+        if not calls:
+            return []
+        # Refresh the JWT once up front rather than racing a refresh in every worker
+        if self.account is not None:
+            self._validate_auth()
+        with ThreadPoolExecutor(max_workers=min(len(calls), max_workers)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    async def run_async(self, call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client method in the event loop's default executor,
+            so that async applications are not stalled for a network round trip.
+
+        Args:
+            call: Client method to run, e.g. `fetch_orderbook`
+            *args: Positional arguments for `call`
+            **kwargs: Keyword arguments for `call`
+
+        Examples:
+            >>> book = await paradex.api_client.run_async(paradex.api_client.fetch_orderbook, "ETH-USD-PERP")
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(call, *args, **kwargs))
 
     # PRIVATE GET METHODS
     def fetch_orders(self, params: Optional[Dict] = None) -> Dict:
@@ -99,6 +258,19 @@ class ParadexApiClient(HttpClient):
         """
         return self._get_authorized(path="orders", params=params)
 
+    def fetch_orders_multi(self, markets: Sequence[str]) -> Dict[str, Dict]:
+        """Fetch open orders for several markets concurrently.
+            Private endpoint requires authorization.
+
+        Args:
+            markets: Market Names
+
+        Returns:
+            Orders response of `fetch_orders` keyed by market
+        """
+        responses = self.fetch_many([functools.partial(self.fetch_orders, {"market": market}) for market in markets])
+        return dict(zip(markets, responses))
+
     def fetch_orders_history(self, params: Optional[Dict] = None) -> Dict:
         """Fetch history of orders for the account.
             Private endpoint requires authorization.
@@ -122,6 +294,18 @@ class ParadexApiClient(HttpClient):
         """
         return self._get_authorized(path="orders-history", params=params)
 
+    def iter_orders_history(self, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Iterate over history of orders for the account, following the `next` cursor page by page.
+            Private endpoint requires authorization.
+
+        Args:
+            params: Same as `fetch_orders_history`, without `cursor`
+
+        Returns:
+            Iterator over the `results` of every page, the next page is prefetched while the current one is consumed
+        """
+        return self._iter_pages(self.fetch_orders_history, params)
+
     def fetch_order(self, order_id: str) -> Dict:
         """Fetch a state of specific order sent from this account.
             Private endpoint requires authorization.
@@ -159,6 +343,18 @@ class ParadexApiClient(HttpClient):
         """
         return self._get_authorized(path="fills", params=params)
 
+    def iter_fills(self, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Iterate over history of fills for this account, following the `next` cursor page by page.
+            Private endpoint requires authorization.
+
+        Args:
+            params: Same as `fetch_fills`, without `cursor`
+
+        Returns:
+            Iterator over the `results` of every page, the next page is prefetched while the current one is consumed
+        """
+        return self._iter_pages(self.fetch_fills, params)
+
     def fetch_tradebusts(self, params: Optional[Dict] = None) -> Dict:
         """Fetch history of tradebusts for this account.
 
@@ -195,6 +391,18 @@ class ParadexApiClient(HttpClient):
         """
         return self._get_authorized(path="funding/payments", params=params)
 
+    def iter_funding_payments(self, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Iterate over history of funding payments for this account, following the `next` cursor page by page.
+            Private endpoint requires authorization.
+
+        Args:
+            params: Same as `fetch_funding_payments`, without `cursor`
+
+        Returns:
+            Iterator over the `results` of every page, the next page is prefetched while the current one is consumed
+        """
+        return self._iter_pages(self.fetch_funding_payments, params)
+
     def fetch_funding_data(self, params: Optional[Dict] = None) -> Dict:
         """List historical funding data by market
 
@@ -231,6 +439,18 @@ class ParadexApiClient(HttpClient):
         """
         return self._get_authorized(path="transactions", params=params)
 
+    def iter_transactions(self, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Iterate over history of transactions initiated by this account, following the `next` cursor page by page.
+            Private endpoint requires authorization.
+
+        Args:
+            params: Same as `fetch_transactions`, without `cursor`
+
+        Returns:
+            Iterator over the `results` of every page, the next page is prefetched while the current one is consumed
+        """
+        return self._iter_pages(self.fetch_transactions, params)
+
     def fetch_transfers(self, params: Optional[Dict] = None) -> Dict:
         """Fetch history of transfers initiated by this account.
             Private endpoint requires authorization.
@@ -250,12 +470,24 @@ class ParadexApiClient(HttpClient):
         """
         return self._get_authorized(path="transfers", params=params)
 
+    def iter_transfers(self, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Iterate over history of transfers initiated by this account, following the `next` cursor page by page.
+            Private endpoint requires authorization.
+
+        Args:
+            params: Same as `fetch_transfers`, without `cursor`
+
+        Returns:
+            Iterator over the `results` of every page, the next page is prefetched while the current one is consumed
+        """
+        return self._iter_pages(self.fetch_transfers, params)
+
     def fetch_account_summary(self) -> AccountSummary:
         """Fetch current summary for this account.
         Private endpoint requires authorization.
         """
         res = self._get_authorized(path="account")
-        return AccountSummarySchema().load(res, unknown="exclude", partial=True)
+        return _ACCOUNT_SUMMARY_SCHEMA.load(res)
 
     def fetch_account_profile(self) -> Dict:
         """Fetch profile for this account.
@@ -322,7 +554,7 @@ class ParadexApiClient(HttpClient):
             prev (str): The pointer to fetch previous set of records (null if there are no records left)
             results (list): List of Trades
         """
-        if "market" not in params:
+        if not (params or {}).get("market"):
             return raise_value_error(f"{self.classname}: Market is required to fetch trades")
         return self._get(path="trades", params=params)
 
@@ -333,10 +565,31 @@ class ParadexApiClient(HttpClient):
         Args:
             order: Order containing all required fields.
         """
+        if self.account is None:
+            return raise_value_error(f"{self.classname}: Account not initialized")
         order.signature = self.account.sign_order(order)
         order_payload = order.dump_to_dict()
         return self._post_authorized(path="orders", payload=order_payload)
 
+    def submit_orders_batch(self, orders: List[Order]) -> Dict:
+        """Send a batch of orders to Paradex in a single request.
+            Private endpoint requires authorization.
+
+        Args:
+            orders: Orders containing all required fields.
+
+        Returns:
+            orders (list): Accepted orders
+            errors (list): Errors of rejected orders
+        """
+        if self.account is None:
+            return raise_value_error(f"{self.classname}: Account not initialized")
+        order_payloads = []
+        for order in orders:
+            order.signature = self.account.sign_order(order)
+            order_payloads.append(order.dump_to_dict())
+        return self._post_authorized(path="orders/batch", payload=order_payloads)
+
     def cancel_order(self, order_id: str) -> None:
         """Cancel open order previously sent to Paradex from this account.
             Private endpoint requires authorization.
@@ -346,6 +599,16 @@ class ParadexApiClient(HttpClient):
         """
         self._delete_authorized(path=f"orders/{order_id}")
 
+    def cancel_orders(self, order_ids: Sequence[str]) -> None:
+        """Cancel several open orders previously sent to Paradex from this account.
+            Cancel requests are sent concurrently.
+            Private endpoint requires authorization.
+
+        Args:
+            order_ids: Order Ids
+        """
+        self.fetch_many([functools.partial(self.cancel_order, order_id) for order_id in order_ids])
+
     def cancel_order_by_client_id(self, client_id: str) -> None:
         """Cancel open order previously sent to Paradex from this account.
             Private endpoint requires authorization.
@@ -368,18 +631,21 @@ class ParadexApiClient(HttpClient):
     # PUBLIC GET METHODS
     def fetch_system_config(self) -> SystemConfig:
         """Fetch Paradex system config.
+            Cached for `SYSTEM_CONFIG_CACHE_TTL` seconds, each call returns its own copy.
 
         Examples:
             >>> paradex.api_client.fetch_system_config()
             >>> { ..., "paraclear_decimals": 8, ... }
         """
+        return self._get_cached(("system/config",), SYSTEM_CONFIG_CACHE_TTL, self._load_system_config)
 
+    def _load_system_config(self) -> SystemConfig:
         res = self.request(
             url=f"{self.api_url}/system/config",
             http_method=HttpMethod.GET,
         )
-        config = SystemConfigSchema().load(res, unknown="exclude", partial=True)
-        self.logger.info(f"{self.classname}: SystemConfig:{config}")
+        config = _SYSTEM_CONFIG_SCHEMA.load(res)
+        self.logger.info("%s: SystemConfig:%s", self.classname, config)
         return config
 
     def fetch_system_state(self) -> Dict:
@@ -412,8 +678,13 @@ class ParadexApiClient(HttpClient):
 
         Returns:
             results (list): List of Markets
+
+        Note:
+            Responses are cached per `params` for `MARKETS_CACHE_TTL` seconds,
+            each call returns its own copy.
         """
-        return self._get(path="markets", params=params)
+        key = ("markets", tuple(sorted(params.items())) if params else ())
+        return self._get_cached(key, MARKETS_CACHE_TTL, functools.partial(self._get, path="markets", params=params))
 
     def fetch_markets_summary(self, params: Optional[Dict] = None) -> Dict:
         """Fetch ticker information for specific market.
@@ -439,6 +710,20 @@ class ParadexApiClient(HttpClient):
         """
         return self._get(path=f"orderbook/{market}", params=params)
 
+    def fetch_orderbooks(self, markets: Sequence[str], params: Optional[Dict] = None) -> Dict[str, Dict]:
+        """Fetch order-books for several markets concurrently.
+
+        Args:
+            markets: Market Names
+            params:
+                `depth`: Depth
+
+        Returns:
+            Order-book response of `fetch_orderbook` keyed by market
+        """
+        responses = self.fetch_many([functools.partial(self.fetch_orderbook, market, params) for market in markets])
+        return dict(zip(markets, responses))
+
     def fetch_bbo(self, market: str) -> Dict:
         """Fetch best bid/offer for specific market.
 
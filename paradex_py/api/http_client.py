@@ -1,9 +1,21 @@
+import time
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
 from paradex_py.api.models import ApiErrorSchema
+from paradex_py.constants import HTTP_RATE_LIMIT_BASE_DELAY, HTTP_RATE_LIMIT_MAX_DELAY, HTTP_RATE_LIMIT_RETRIES
+
+_API_ERROR_SCHEMA = ApiErrorSchema()
+
+
+def _retry_delay(res: httpx.Response, attempt: int) -> float:
+    retry_after = res.headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        # The header is server controlled, never block a caller for longer than the cap
+        return min(float(retry_after), HTTP_RATE_LIMIT_MAX_DELAY)
+    return HTTP_RATE_LIMIT_BASE_DELAY * 2**attempt
 
 
 class HttpMethod(Enum):
@@ -13,10 +25,25 @@ class HttpMethod(Enum):
 
 
 class HttpClient:
-    def __init__(self):
-        self.client = httpx.Client()
+    def __init__(self, http2: bool = False):
+        # httpx drops idle keep-alive connections after 5s by default, which makes
+        # periodic polling pay a fresh TCP+TLS handshake on almost every call
+        self.client = httpx.Client(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60),
+            http2=http2,
+        )
         self.client.headers.update({"Content-Type": "application/json"})
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self.client.close()
+
     def request(
         self,
         url: str,
@@ -25,15 +52,20 @@ class HttpClient:
         payload: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
         headers: Optional[Any] = None,
     ):
-        res = self.client.request(
-            method=http_method.value,
-            url=url,
-            params=params,
-            json=payload,
-            headers=headers,
-        )
+        for attempt in range(HTTP_RATE_LIMIT_RETRIES + 1):
+            res = self.client.request(
+                method=http_method.value,
+                url=url,
+                params=params,
+                json=payload,
+                headers=headers,
+            )
+            # A rate limited request was not processed, so it is safe to send again
+            if res.status_code != httpx.codes.TOO_MANY_REQUESTS or attempt == HTTP_RATE_LIMIT_RETRIES:
+                break
+            time.sleep(_retry_delay(res, attempt))
         if res.status_code >= 300:
-            error = ApiErrorSchema().loads(res.text)
+            error = _API_ERROR_SCHEMA.loads(res.text)
             raise Exception(error)
         try:
             return res.json()
@@ -45,11 +77,10 @@ class HttpClient:
             url=f"{api_url}/{path}",
             http_method=HttpMethod.GET,
             params=params,
-            headers=self.client.headers,
         )
 
-    # post is always private, use either provided headers
-    # or the client headers with JWT token
+    # post is always private, provided headers are merged over
+    # the client headers, the JWT is added by the client auth
     def post(
         self,
         api_url: str,
@@ -58,13 +89,12 @@ class HttpClient:
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
     ) -> dict:
-        use_headers = headers if headers else self.client.headers
         return self.request(
             url=f"{api_url}/{path}",
             http_method=HttpMethod.POST,
             payload=payload,
             params=params,
-            headers=use_headers,
+            headers=headers,
         )
 
     def delete(
@@ -77,5 +107,4 @@ class HttpClient:
             url=f"{api_url}/{path}",
             http_method=HttpMethod.DELETE,
             params=params,
-            headers=self.client.headers,
         )
@@ -1,7 +1,9 @@
 import asyncio
+import contextlib
+import functools
 import json
 import logging
-import time
+import random
 import traceback
 from enum import Enum
 from typing import Callable, Dict, Optional
@@ -9,8 +11,9 @@ from typing import Callable, Dict, Optional
 import websockets
 
 from paradex_py.account.account import ParadexAccount
-from paradex_py.constants import WS_READ_TIMEOUT
+from paradex_py.constants import WS_RECONNECT_BASE_DELAY, WS_RECONNECT_MAX_ATTEMPTS, WS_RECONNECT_MAX_DELAY
 from paradex_py.environment import Environment
+from paradex_py.utils import time_now_micro_secs
 
 
 class ParadexWebsocketChannel(Enum):
@@ -57,9 +60,14 @@ def _paradex_channel_prefix(value: str) -> str:
     return value.split(".")[0]
 
 
+_CHANNEL_PREFIXES = tuple((_paradex_channel_prefix(channel.value), channel) for channel in ParadexWebsocketChannel)
+
+
+# Called for every received message, the set of channel names seen by a client is small
+@functools.lru_cache(maxsize=1024)
 def _get_ws_channel_from_name(message_channel: str) -> Optional[ParadexWebsocketChannel]:
-    for channel in ParadexWebsocketChannel:
-        if message_channel.startswith(_paradex_channel_prefix(channel.value)):
+    for prefix, channel in _CHANNEL_PREFIXES:
+        if message_channel.startswith(prefix):
             return channel
     return None
 
@@ -89,13 +97,23 @@ class ParadexWebsocketClient:
         self.env = env
         self.api_url = f"wss://ws.api.{self.env}.paradex.trade/v1"
         self.logger = logger or logging.getLogger(__name__)
+        self.account: Optional[ParadexAccount] = None
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self.callbacks: Dict[str, Callable] = {}
         self.subscribed_channels: Dict[str, bool] = {}
-        asyncio.get_event_loop().create_task(self._read_messages())
+        # Set while the client closes its own connection, so the reader does not reconnect
+        self._closing = False
+        self._reader_task: asyncio.Task = asyncio.get_event_loop().create_task(self._read_messages())
+
+    async def __aenter__(self):
+        return self
 
-    async def __aexit__(self):
+    async def __aexit__(self, *exc_info):
+        self._closing = True
         await self._close_connection()
+        self._reader_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._reader_task
 
     def init_account(self, account: ParadexAccount) -> None:
         self.account = account
@@ -114,6 +132,10 @@ class ParadexWebsocketClient:
         """
 
         try:
+            self._closing = False
+            # The reader is stopped when the client is used as a context manager and exits
+            if self._reader_task.done():
+                self._reader_task = asyncio.get_running_loop().create_task(self._read_messages())
             self.subscribed_channels = {}
             extra_headers = {}
             if self.account:
@@ -149,13 +171,21 @@ class ParadexWebsocketClient:
             self.logger.exception(f"{self.classname}: Error thrown when closing connection {traceback.format_exc()}")
 
     async def _reconnect(self):
-        try:
-            self.logger.info(f"{self.classname}: Reconnect websocket...")
-            await self._close_connection()
-            await self.connect()
-            await self._resubscribe()
-        except Exception:
-            self.logger.exception(f"{self.classname}: Reconnect failed {traceback.format_exc()}")
+        self.logger.info(f"{self.classname}: Reconnect websocket...")
+        for attempt in range(WS_RECONNECT_MAX_ATTEMPTS):
+            try:
+                await self._close_connection()
+                if await self.connect():
+                    await self._resubscribe()
+                    return
+            except Exception:
+                self.logger.exception(f"{self.classname}: Reconnect failed {traceback.format_exc()}")
+            # Exponential backoff with jitter so that clients do not reconnect in lockstep
+            delay = min(WS_RECONNECT_BASE_DELAY * 2**attempt, WS_RECONNECT_MAX_DELAY)
+            delay *= random.uniform(0.5, 1.5)  # noqa: S311
+            self.logger.info(f"{self.classname}: Reconnect attempt:{attempt + 1} failed, retry in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        self.logger.error(f"{self.classname}: Reconnect gave up after {WS_RECONNECT_MAX_ATTEMPTS} attempts")
 
     async def _resubscribe(self):
         if self.ws and self.ws.open:
@@ -175,7 +205,7 @@ class ParadexWebsocketClient:
         await websocket.send(
             json.dumps(
                 {
-                    "id": int(time.time() * 1_000_000),
+                    "id": time_now_micro_secs(),
                     "jsonrpc": "2.0",
                     "method": "auth",
                     "params": {"bearer": paradex_jwt},
@@ -187,43 +217,48 @@ class ParadexWebsocketClient:
         if "id" in message:
             channel_subscribed: Optional[str] = message.get("result", {}).get("channel")
             if channel_subscribed:
-                self.logger.info(f"{self.classname}: Subscribed to channel:{channel_subscribed}")
+                self.logger.info("%s: Subscribed to channel:%s", self.classname, channel_subscribed)
                 self.subscribed_channels[channel_subscribed] = True
 
+    async def _process_message(self, message: dict) -> None:
+        self._check_subscribed_channel(message)
+        if "params" not in message:
+            self.logger.debug("%s: Non-actionable message:%s", self.classname, message)
+            return
+        message_channel = message["params"].get("channel")
+        ws_channel: Optional[ParadexWebsocketChannel] = _get_ws_channel_from_name(message_channel)
+        if ws_channel is None:
+            self.logger.debug("%s: unregistered channel:%s message:%s", self.classname, message_channel, message)
+        elif message_channel in self.callbacks:
+            self.logger.debug(
+                "%s: channel:%s callback:%s message:%s",
+                self.classname,
+                message_channel,
+                self.callbacks[message_channel],
+                message,
+            )
+            await self.callbacks[message_channel](ws_channel, message)
+        else:
+            self.logger.info("%s: Non-callback channel:%s", self.classname, message_channel)
+
     async def _read_messages(self):
         while True:
             if self.ws and self.ws.open:
                 try:
-                    response = await asyncio.wait_for(self.ws.recv(), timeout=WS_READ_TIMEOUT)
-                    message = json.loads(response)
-                    self._check_subscribed_channel(message)
-                    if "params" not in message:
-                        self.logger.debug(f"{self.classname}: Non-actionable message:{message}")
-                    else:
-                        message_channel = message["params"].get("channel")
-                        ws_channel: Optional[ParadexWebsocketChannel] = _get_ws_channel_from_name(message_channel)
-                        if ws_channel is None:
-                            self.logger.debug(
-                                f"{self.classname}: unregistered channel:{message_channel} message:{message}"
-                            )
-                        elif message_channel in self.callbacks:
-                            self.logger.debug(
-                                f"{self.classname}: channel:{message_channel}"
-                                f" callback:{self.callbacks[message_channel]}"
-                                f" message:{message}"
-                            )
-                            await self.callbacks[message_channel](ws_channel, message)
-                        else:
-                            self.logger.info(f"{self.classname}: Non-callback channel:{message_channel}")
-                    # yield message
+                    # Iterating the connection waits for frames without a per-message timer
+                    # and only stops once the connection is closed
+                    async for response in self.ws:
+                        await self._process_message(json.loads(response))
+                    self.logger.info(f"{self.classname}: Connection closed")
+                    if not self._closing:
+                        await self._reconnect()
                 except (
                     websockets.exceptions.ConnectionClosedError,
                     websockets.exceptions.ConnectionClosedOK,
                 ):
                     self.logger.exception(f"{self.classname}: Connection closed traceback:{traceback.format_exc()}")
-                    await self._reconnect()
-                except asyncio.TimeoutError:
-                    pass
+                    if not self._closing:
+                        await self._reconnect()
                 except Exception:
                     self.logger.exception(f"{self.classname}: Connection failed traceback:{traceback.format_exc()}")
                     await asyncio.sleep(1)
@@ -271,7 +306,9 @@ class ParadexWebsocketClient:
             params = {}
         channel_name = channel.value.format(**params)
         self.callbacks[channel_name] = callback
-        self.logger.info(f"{self.classname}: Subscribe channel:{channel_name} params:{params} callback:{callback}")
+        self.logger.info(
+            "%s: Subscribe channel:%s params:%s callback:%s", self.classname, channel_name, params, callback
+        )
         await self._subscribe_to_channel_by_name(channel_name)
 
     async def _subscribe_to_channel_by_name(
@@ -281,7 +318,7 @@ class ParadexWebsocketClient:
         await self._send(
             json.dumps(
                 {
-                    "id": int(time.time() * 1_000_000),
+                    "id": time_now_micro_secs(),
                     "jsonrpc": "2.0",
                     "method": "subscribe",
                     "params": {"channel": channel_name},
@@ -8,4 +8,19 @@ USDC_DECIMALS = 6
 BUY_SIDE = 1
 SELL_SIDE = 2
 
-WS_READ_TIMEOUT = 5
+# Seconds before the JWT expiry at which it is refreshed
+JWT_REFRESH_LEEWAY = 60
+
+# Retries of a REST request rejected with 429 Too Many Requests
+HTTP_RATE_LIMIT_RETRIES = 3
+HTTP_RATE_LIMIT_BASE_DELAY = 0.5
+# Longest wait honoured from a Retry-After header
+HTTP_RATE_LIMIT_MAX_DELAY = 10
+
+# Seconds near-static public responses are served from the client cache
+SYSTEM_CONFIG_CACHE_TTL = 300
+MARKETS_CACHE_TTL = 60
+
+WS_RECONNECT_MAX_ATTEMPTS = 8
+WS_RECONNECT_BASE_DELAY = 0.5
+WS_RECONNECT_MAX_DELAY = 30
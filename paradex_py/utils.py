@@ -7,11 +7,11 @@ def random_max_fee(start: int = 10**18, end: int = 10**19) -> int:
 
 
 def time_now_milli_secs() -> int:
-    return int(time.time() * 1_000)
+    return time.time_ns() // 1_000_000
 
 
 def time_now_micro_secs() -> int:
-    return int(time.time() * 1_000_000)
+    return time.time_ns() // 1_000
 
 
 def raise_value_error(message: str):
@@ -1,7 +1,13 @@
 from starknet_py.common import int_from_hex
+from starknet_py.constants import EC_ORDER
 
 from paradex_py.account.account import ParadexAccount
-from paradex_py.account.utils import typed_data_to_message_hash, unflatten_signature, verify_message_signature
+from paradex_py.account.utils import (
+    flatten_signature,
+    typed_data_to_message_hash,
+    unflatten_signature,
+    verify_message_signature,
+)
 from paradex_py.message.auth import build_auth_message
 from paradex_py.message.onboarding import build_onboarding_message
 from tests.mocks.api_client import MockApiClient
@@ -89,3 +95,29 @@ def test_account_auth_signature():
         account.l2_public_key,
     )
     assert is_signature_valid is True
+
+
+def test_unflatten_signature():
+    sig = [2**251 + 17, 1]
+    assert unflatten_signature(flatten_signature(sig)) == sig
+    assert unflatten_signature('[ "12" , "34" ]') == [12, 34]
+    assert unflatten_signature(' [\n  "12",\n  "34"\n] ') == [12, 34]
+
+
+def test_verify_message_signature_out_of_range():
+    api_client = MockApiClient()
+    config = api_client.fetch_system_config()
+
+    account = ParadexAccount(
+        config=config,
+        l1_address=TEST_L1_ADDRESS,
+        l2_private_key=TEST_L2_PRIVATE_KEY,
+    )
+
+    message = build_onboarding_message(account.l2_chain_id)
+    msg_hash = typed_data_to_message_hash(message, account.l2_address)
+    r, s = unflatten_signature(account.onboarding_signature())
+    assert verify_message_signature(msg_hash, [r, s], account.l2_public_key) is True
+
+    for signature in ([0, s], [r, 0], [EC_ORDER, s], [r, EC_ORDER], [-r, s], [r, s + EC_ORDER]):
+        assert verify_message_signature(msg_hash, signature, account.l2_public_key) is False
@@ -0,0 +1,422 @@
+import base64
+import functools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from paradex_py.api import api_client as api_client_module
+from paradex_py.api.api_client import ParadexApiClient
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.constants import JWT_REFRESH_LEEWAY
+from paradex_py.environment import TESTNET
+from tests.mocks.api_client import MOCK_CONFIG
+
+MOCK_MARKETS = {"results": [{"symbol": "ETH-USD-PERP"}, {"symbol": "BTC-USD-PERP"}]}
+
+
+def _mock_api_client(handler) -> ParadexApiClient:
+    api_client = ParadexApiClient(env=TESTNET)
+    api_client.client = httpx.Client(transport=httpx.MockTransport(handler), auth=api_client._bearer_auth)
+    return api_client
+
+
+def _jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"e30.{payload}.signature"
+
+
+class _MockAccount:
+    jwt_token = ""
+
+    def auth_headers(self) -> dict:
+        return {"PARADEX-STARKNET-SIGNATURE": "[]"}
+
+    def set_jwt_token(self, jwt_token: str) -> None:
+        self.jwt_token = jwt_token
+
+    def sign_order(self, order: Order) -> str:
+        return f'["{order.market}","{order.signature_timestamp}"]'
+
+
+def _authorized_api_client(handler) -> ParadexApiClient:
+    def auth_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/auth":
+            return httpx.Response(200, json={"jwt_token": _jwt({})})
+        return handler(request)
+
+    api_client = _mock_api_client(auth_handler)
+    api_client.account = _MockAccount()
+    api_client.auth()
+    return api_client
+
+
+def _public_handler(requests: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/v1/system/config":
+            return httpx.Response(200, json=MOCK_CONFIG)
+        return httpx.Response(200, json=MOCK_MARKETS)
+
+    return handler
+
+
+def test_fetch_markets_is_cached_per_params():
+    requests: list = []
+    api_client = _mock_api_client(_public_handler(requests))
+
+    assert api_client.fetch_markets() == MOCK_MARKETS
+    assert api_client.fetch_markets() == MOCK_MARKETS
+    assert len(requests) == 1
+
+    api_client.fetch_markets(params={"market": "ETH-USD-PERP"})
+    api_client.fetch_markets(params={"market": "ETH-USD-PERP"})
+    assert len(requests) == 2
+    assert requests[1].url.params["market"] == "ETH-USD-PERP"
+
+
+def test_fetch_markets_returns_a_copy():
+    requests: list = []
+    api_client = _mock_api_client(_public_handler(requests))
+
+    markets = api_client.fetch_markets()
+    markets["results"].clear()
+
+    assert api_client.fetch_markets() == MOCK_MARKETS
+    assert len(requests) == 1
+
+
+def test_fetch_system_config_is_cached():
+    requests: list = []
+    api_client = _mock_api_client(_public_handler(requests))
+
+    config = api_client.fetch_system_config()
+    config.bridged_tokens.clear()
+
+    assert api_client.fetch_system_config().bridged_tokens[0].symbol == "USDC"
+    assert len(requests) == 1
+
+
+def test_cache_expiry(monkeypatch):
+    requests: list = []
+    api_client = _mock_api_client(_public_handler(requests))
+    monkeypatch.setattr(api_client_module, "MARKETS_CACHE_TTL", 0)
+
+    api_client.fetch_markets()
+    api_client.fetch_markets()
+    assert len(requests) == 2
+
+
+def test_concurrent_cache_misses_issue_one_request():
+    requests: list = []
+    public_handler = _public_handler(requests)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Keep the first request in flight while the other threads miss the cache
+        time.sleep(0.1)
+        return public_handler(request)
+
+    api_client = _mock_api_client(handler)
+    barrier = threading.Barrier(8)
+
+    def fetch_markets() -> dict:
+        barrier.wait()
+        return api_client.fetch_markets()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = [future.result() for future in [executor.submit(fetch_markets) for _ in range(8)]]
+
+    assert results == [MOCK_MARKETS] * 8
+    assert len(requests) == 1
+
+
+def test_invalidate_cache_by_path():
+    requests: list = []
+    api_client = _mock_api_client(_public_handler(requests))
+
+    api_client.fetch_markets()
+    api_client.fetch_system_config()
+    assert len(requests) == 2
+
+    api_client.invalidate_cache("system/config")
+    api_client.fetch_markets()
+    api_client.fetch_system_config()
+    assert [request.url.path for request in requests[2:]] == ["/v1/system/config"]
+
+    api_client.invalidate_cache()
+    api_client.fetch_markets()
+    api_client.fetch_system_config()
+    assert len(requests) == 5
+
+
+def test_invalidate_cache_drops_every_params_variant():
+    requests: list = []
+    api_client = _mock_api_client(_public_handler(requests))
+
+    api_client.fetch_markets()
+    api_client.fetch_markets(params={"market": "ETH-USD-PERP"})
+    api_client.invalidate_cache("markets")
+    api_client.fetch_markets()
+    api_client.fetch_markets(params={"market": "ETH-USD-PERP"})
+    assert len(requests) == 4
+
+
+def _paged_handler(requests: list):
+    pages = {
+        None: {"next": "c1", "results": [{"id": 1}, {"id": 2}]},
+        "c1": {"next": "c2", "results": []},
+        "c2": {"next": None, "results": [{"id": 3}]},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=pages[request.url.params.get("cursor")])
+
+    return handler
+
+
+def test_iter_pages_follows_next_cursor():
+    requests: list = []
+    api_client = _authorized_api_client(_paged_handler(requests))
+
+    fills = list(api_client.iter_fills(params={"market": "ETH-USD-PERP"}))
+
+    assert fills == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert [request.url.params.get("cursor") for request in requests] == [None, "c1", "c2"]
+    assert all(request.url.path == "/v1/fills" for request in requests)
+    assert all(request.url.params["market"] == "ETH-USD-PERP" for request in requests)
+
+
+def test_iter_pages_stops_without_next():
+    requests: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"next": None, "results": [{"id": 1}]})
+
+    api_client = _authorized_api_client(handler)
+
+    assert list(api_client.iter_transfers()) == [{"id": 1}]
+    assert len(requests) == 1
+    assert "cursor" not in requests[0].url.params
+
+
+def test_iter_pages_prefetches_next_page():
+    second_page_requested = threading.Event()
+    pages = {
+        None: {"next": "c1", "results": [{"id": 1}, {"id": 2}]},
+        "c1": {"next": None, "results": [{"id": 3}]},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor")
+        if cursor == "c1":
+            second_page_requested.set()
+        return httpx.Response(200, json=pages[cursor])
+
+    api_client = _authorized_api_client(handler)
+    fills = api_client.iter_fills()
+
+    assert next(fills) == {"id": 1}
+    # The second page is on its way while the first one is still being consumed
+    assert second_page_requested.wait(timeout=5)
+    assert list(fills) == [{"id": 2}, {"id": 3}]
+
+
+def test_auth_refresh_ignores_local_clock_skew(monkeypatch):
+    issued_at = int(time.time())
+    auth_requests: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/auth":
+            auth_requests.append(request)
+            return httpx.Response(200, json={"jwt_token": _jwt({"iat": issued_at, "exp": issued_at + 300})})
+        return httpx.Response(200, json={"results": []})
+
+    # Local wall clock an hour ahead of the server that issued the token
+    monkeypatch.setattr(api_client_module.time, "time", lambda: issued_at + 3600)
+    api_client = _mock_api_client(handler)
+    api_client.account = _MockAccount()
+    api_client.auth()
+
+    api_client.fetch_fills()
+    api_client.fetch_fills()
+
+    assert len(auth_requests) == 1
+    assert 230 < api_client.auth_deadline - time.monotonic() <= 240
+
+
+def test_auth_refresh_fallback_without_usable_claims():
+    for claims in ({}, {"exp": 1}, {"iat": 30, "exp": 0}):
+
+        def handler(request: httpx.Request, claims=claims) -> httpx.Response:
+            return httpx.Response(200, json={"jwt_token": _jwt(claims)})
+
+        api_client = _mock_api_client(handler)
+        api_client.account = _MockAccount()
+        api_client.auth()
+
+        assert 4 * 60 - 10 < api_client.auth_deadline - time.monotonic() <= 4 * 60
+
+
+def test_auth_refresh_within_short_token_lifetime():
+    for lifetime, refresh_in in ((30, 15), (2 * JWT_REFRESH_LEEWAY, JWT_REFRESH_LEEWAY)):
+
+        def handler(request: httpx.Request, lifetime=lifetime) -> httpx.Response:
+            return httpx.Response(200, json={"jwt_token": _jwt({"iat": 0, "exp": lifetime})})
+
+        api_client = _mock_api_client(handler)
+        api_client.account = _MockAccount()
+        api_client.auth()
+
+        # Refreshed before the token expires instead of after the 4 minute fallback
+        assert refresh_in - 10 < api_client.auth_deadline - time.monotonic() <= refresh_in
+
+
+def test_auth_requires_account():
+    requests: list = []
+    api_client = _mock_api_client(_public_handler(requests))
+
+    with pytest.raises(ValueError, match="Account not initialized"):
+        api_client.onboarding()
+    with pytest.raises(ValueError, match="Account not initialized"):
+        api_client.auth()
+    assert requests == []
+
+
+def test_jwt_is_set_by_bearer_auth():
+    jwt_tokens = [_jwt({"jti": "first"}), _jwt({"jti": "second"})]
+    authorizations: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/auth":
+            return httpx.Response(200, json={"jwt_token": jwt_tokens.pop(0)})
+        authorizations.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={"results": []})
+
+    api_client = _mock_api_client(handler)
+    api_client.account = _MockAccount()
+
+    api_client.auth()
+    first_jwt = api_client.account.jwt_token
+    api_client.fetch_orders()
+    api_client.auth()
+    second_jwt = api_client.account.jwt_token
+    api_client.fetch_orders()
+    # Public endpoints carry the current token too, as they did with the client headers
+    api_client.fetch_markets()
+
+    assert first_jwt != second_jwt
+    assert authorizations == [f"Bearer {first_jwt}", f"Bearer {second_jwt}", f"Bearer {second_jwt}"]
+    assert "Authorization" not in api_client.client.headers
+
+
+def test_fetch_many_preserves_order():
+    def delayed(value: int, delay: float):
+        def call() -> int:
+            time.sleep(delay)
+            return value
+
+        return call
+
+    api_client = _mock_api_client(_public_handler([]))
+
+    assert api_client.fetch_many([delayed(1, 0.2), delayed(2, 0.1), delayed(3, 0)]) == [1, 2, 3]
+    assert api_client.fetch_many([]) == []
+
+
+def test_fetch_many_reraises_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/bbo/BAD-MARKET":
+            return httpx.Response(400, json={"error": "INVALID_MARKET", "message": "market not found", "data": None})
+        return httpx.Response(200, json={"market": request.url.path.rsplit("/", 1)[-1]})
+
+    api_client = _mock_api_client(handler)
+
+    with pytest.raises(Exception, match="INVALID_MARKET"):
+        api_client.fetch_many(
+            [
+                functools.partial(api_client.fetch_bbo, "ETH-USD-PERP"),
+                functools.partial(api_client.fetch_bbo, "BAD-MARKET"),
+            ]
+        )
+
+
+def test_fetch_orders_multi():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": [{"market": request.url.params["market"]}]})
+
+    api_client = _authorized_api_client(handler)
+    markets = ["ETH-USD-PERP", "BTC-USD-PERP", "SOL-USD-PERP"]
+
+    orders = api_client.fetch_orders_multi(markets)
+
+    assert list(orders) == markets
+    assert all(orders[market] == {"results": [{"market": market}]} for market in markets)
+
+
+def test_fetch_orderbooks():
+    requests: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"market": request.url.path.rsplit("/", 1)[-1]})
+
+    api_client = _mock_api_client(handler)
+    markets = ["ETH-USD-PERP", "BTC-USD-PERP"]
+
+    orderbooks = api_client.fetch_orderbooks(markets, params={"depth": 5})
+
+    assert orderbooks == {market: {"market": market} for market in markets}
+    assert all(request.url.params["depth"] == "5" for request in requests)
+
+
+def test_submit_orders_batch():
+    requests: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"orders": [], "errors": []})
+
+    api_client = _authorized_api_client(handler)
+    orders = [
+        Order(
+            market=market,
+            order_type=OrderType.Limit,
+            order_side=OrderSide.Buy,
+            size=Decimal("0.1"),
+            limit_price=Decimal(1500),
+            signature_timestamp=1634736000000,
+        )
+        for market in ("ETH-USD-PERP", "BTC-USD-PERP")
+    ]
+
+    assert api_client.submit_orders_batch(orders) == {"orders": [], "errors": []}
+    assert len(requests) == 1
+    assert requests[0].method == "POST"
+    assert requests[0].url.path == "/v1/orders/batch"
+    payload = json.loads(requests[0].content)
+    assert [order["market"] for order in payload] == ["ETH-USD-PERP", "BTC-USD-PERP"]
+    assert [order["signature"] for order in payload] == [
+        '["ETH-USD-PERP","1634736000000"]',
+        '["BTC-USD-PERP","1634736000000"]',
+    ]
+
+
+def test_cancel_orders():
+    requests: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(204)
+
+    api_client = _authorized_api_client(handler)
+
+    api_client.cancel_orders(["1", "2", "3"])
+
+    assert all(request.method == "DELETE" for request in requests)
+    assert sorted(request.url.path for request in requests) == ["/v1/orders/1", "/v1/orders/2", "/v1/orders/3"]
@@ -0,0 +1,59 @@
+import httpx
+import pytest
+
+from paradex_py.api import http_client as http_client_module
+from paradex_py.api.http_client import HttpClient
+from paradex_py.constants import HTTP_RATE_LIMIT_BASE_DELAY, HTTP_RATE_LIMIT_MAX_DELAY, HTTP_RATE_LIMIT_RETRIES
+
+RATE_LIMITED = {"error": "RATE_LIMIT", "message": "rate limit exceeded", "data": None}
+
+
+def _mock_http_client(responses: list, requests: list) -> HttpClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    http_client = HttpClient()
+    http_client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return http_client
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list:
+    sleeps: list = []
+    monkeypatch.setattr(http_client_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_rate_limited_request_is_retried(sleeps):
+    requests: list = []
+    responses = [httpx.Response(429, json=RATE_LIMITED), httpx.Response(200, json={"status": "ok"})]
+    http_client = _mock_http_client(responses, requests)
+
+    assert http_client.get(api_url="https://api.test", path="system/state") == {"status": "ok"}
+    assert len(requests) == 2
+    assert sleeps == [HTTP_RATE_LIMIT_BASE_DELAY]
+
+
+def test_rate_limit_retries_exhausted(sleeps):
+    requests: list = []
+    responses = [httpx.Response(429, json=RATE_LIMITED) for _ in range(HTTP_RATE_LIMIT_RETRIES + 1)]
+    http_client = _mock_http_client(responses, requests)
+
+    with pytest.raises(Exception, match="RATE_LIMIT"):
+        http_client.get(api_url="https://api.test", path="system/state")
+    assert len(requests) == HTTP_RATE_LIMIT_RETRIES + 1
+    assert sleeps == [HTTP_RATE_LIMIT_BASE_DELAY * 2**attempt for attempt in range(HTTP_RATE_LIMIT_RETRIES)]
+
+
+def test_rate_limit_retry_after_is_capped(sleeps):
+    requests: list = []
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}, json=RATE_LIMITED),
+        httpx.Response(429, headers={"Retry-After": "3600"}, json=RATE_LIMITED),
+        httpx.Response(200, json={"status": "ok"}),
+    ]
+    http_client = _mock_http_client(responses, requests)
+
+    assert http_client.get(api_url="https://api.test", path="system/state") == {"status": "ok"}
+    assert sleeps == [2, HTTP_RATE_LIMIT_MAX_DELAY]
@@ -0,0 +1,34 @@
+import asyncio
+
+import websockets
+
+from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.environment import TESTNET
+
+
+async def _exit_context_manager() -> tuple:
+    connections: list = []
+
+    async def handler(websocket):
+        connections.append(websocket)
+        await websocket.wait_closed()
+
+    async with websockets.serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        async with ParadexWebsocketClient(env=TESTNET) as ws_client:
+            ws_client.api_url = f"ws://127.0.0.1:{port}"
+            assert await ws_client.connect()
+            # Let the reader pick up the connection before the client closes it
+            await asyncio.sleep(1.5)
+        # Leave room for a reconnect to reach the server
+        await asyncio.sleep(0.5)
+        return connections, ws_client
+
+
+def test_ws_client_context_manager_stays_closed():
+    connections, ws_client = asyncio.run(_exit_context_manager())
+
+    assert len(connections) == 1
+    assert ws_client.ws is not None
+    assert not ws_client.ws.open
+    assert ws_client._reader_task.done()
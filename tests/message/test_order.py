@@ -1,8 +1,15 @@
 from decimal import Decimal
 
+from starknet_py.utils.typed_data import TypedData as TypedDataDataclass
+
+from paradex_py.account.utils import typed_data_to_message_hash
 from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.message.auth import build_auth_message
+from paradex_py.message.onboarding import build_onboarding_message
 from paradex_py.message.order import build_order_message
 
+TEST_L2_ADDRESS = 0x129C135ED63DF9353885E292BE4426B8ED6122B13C6C0E1BB787288A1F5ADFA
+
 
 def test_build_onboarding_message():
     order = Order(
@@ -41,3 +48,31 @@ def test_build_onboarding_message():
             "price": "150000000000",
         },
     }
+
+
+def test_typed_data_to_message_hash_matches_from_dict():
+    orders = [
+        Order(
+            market=market,
+            order_type=order_type,
+            order_side=order_side,
+            size=Decimal(size),
+            limit_price=Decimal(price),
+            client_id="",
+            signature_timestamp=1634736000000 + i,
+        )
+        for i, (market, order_type, order_side, size, price) in enumerate(
+            [
+                ("ETH-USD-PERP", OrderType.Limit, OrderSide.Buy, "0.1", "1500"),
+                ("BTC-USD-PERP", OrderType.Limit, OrderSide.Sell, "1.25", "65000.5"),
+                ("SOL-USD-PERP", OrderType.Market, OrderSide.Buy, "10", "0"),
+            ]
+        )
+    ]
+    messages = [build_order_message(1, order) for order in orders]
+    messages += [build_auth_message(1, 2, 3), build_onboarding_message(1)]
+    # Hash each message twice so the second pass uses the cached types
+    for typed_data in messages + messages:
+        for address in (TEST_L2_ADDRESS, 1):
+            expected = TypedDataDataclass.from_dict(typed_data).message_hash(address)
+            assert typed_data_to_message_hash(typed_data, address) == expected
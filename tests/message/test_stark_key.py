@@ -1,6 +1,36 @@
+import hashlib
+import random
+
+from starknet_py.common import int_from_hex
+from starknet_py.constants import EC_ORDER
+
+from paradex_py.account.utils import SHA256_EC_MAX_DIGEST, _grind_key, _indexed_sha256, _int_to_bytes
 from paradex_py.message.stark_key import build_stark_key_message
 
 
+# Hex string based implementation the byte based helpers replaced
+def _padded_hex(x: int) -> str:
+    hex_str = hex(x)[2:]
+    return hex_str if len(hex_str) % 2 == 0 else "0" + hex_str
+
+
+def _hex_indexed_sha256(seed: int, index: int) -> int:
+    digest = hashlib.sha256(bytes.fromhex(_padded_hex(seed) + _padded_hex(index))).hexdigest()
+    return int_from_hex(digest)
+
+
+def _hex_grind_key(key_seed: int, key_value_limit: int) -> int:
+    max_allowed_value = SHA256_EC_MAX_DIGEST - (SHA256_EC_MAX_DIGEST % key_value_limit)
+    current_index = 0
+
+    key = _hex_indexed_sha256(seed=key_seed, index=current_index)
+    while key >= max_allowed_value:
+        current_index += 1
+        key = _hex_indexed_sha256(seed=key_seed, index=current_index)
+
+    return key % key_value_limit
+
+
 def test_build_onboarding_message():
     assert build_stark_key_message(11155111) == {
         "message": {
@@ -19,3 +49,21 @@ def test_build_onboarding_message():
             ],
         },
     }
+
+
+def test_indexed_sha256_matches_hex_encoding():
+    rng = random.Random(0)  # noqa: S311
+    seeds = [0, 1, 0xF, 0x10, 0xFF, 0x100, 2**256 - 1]
+    seeds += [rng.getrandbits(rng.randint(1, 256)) for _ in range(500)]
+    for seed in seeds:
+        for index in (0, 1, 15, 16, 255, 256, 65535):
+            assert _indexed_sha256(seed=_int_to_bytes(seed), index=index) == _hex_indexed_sha256(seed, index)
+
+
+def test_grind_key_matches_hex_encoding():
+    rng = random.Random(0)  # noqa: S311
+    seeds = [0, 1, 2**256 - 1] + [rng.getrandbits(256) for _ in range(500)]
+    for seed in seeds:
+        assert _grind_key(seed, EC_ORDER) == _hex_grind_key(seed, EC_ORDER)
+        # Small limit forces the generic bound and a few grinding rounds
+        assert _grind_key(seed, 2**255 + 1) == _hex_grind_key(seed, 2**255 + 1)